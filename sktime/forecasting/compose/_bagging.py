@@ -338,8 +338,9 @@ def _calculate_data_quantiles(df: pd.DataFrame, alpha: List[float]) -> pd.DataFr
     index = pd.MultiIndex.from_product([["Quantiles"], alpha])
     pred_quantiles = pd.DataFrame(columns=index)
     for a in alpha:
+        # squeeze columns only, to keep a Series if there is a single time point
         pred_quantiles[("Quantiles", a)] = (
-            df.groupby(level=-1, as_index=True).quantile(a).squeeze()
+            df.groupby(level=-1, as_index=True).quantile(a).squeeze(axis=1)
         )
 
     return pred_quantiles
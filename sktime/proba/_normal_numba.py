@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Isolated numba imports for Normal distribution kernels.
+
+All kernels are elementwise and operate on 2D float64 arrays of equal shape,
+writing the result into the pre-allocated 2D array `out`.
+`mu` and `sigma` must be broadcast to the shape of `x` by the caller.
+"""
+
+import math
+
+import numpy as np
+
+from sktime.utils.numba.njit import njit
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+if _check_soft_dependencies("numba", severity="none"):
+    from numba import prange
+else:
+    prange = range
+
+# fastmath is not used, since it assumes absence of nan and inf,
+# which would change results at boundary values, e.g., ppf at 0 or 1
+
+_SQRT_2 = math.sqrt(2.0)
+_LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+
+
+@njit(parallel=True, cache=True)
+def _pdf_kernel(x, mu, sigma, out):
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            z = (x[i, j] - mu[i, j]) / sigma[i, j]
+            out[i, j] = math.exp(-0.5 * z * z - _LOG_SQRT_2PI) / sigma[i, j]
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _log_pdf_kernel(x, mu, sigma, out):
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            z = (x[i, j] - mu[i, j]) / sigma[i, j]
+            out[i, j] = -0.5 * z * z - _LOG_SQRT_2PI - math.log(sigma[i, j])
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _cdf_kernel(x, mu, sigma, out):
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            z = (x[i, j] - mu[i, j]) / sigma[i, j]
+            # erfc form is accurate in the lower tail, same as scipy's ndtr
+            out[i, j] = 0.5 * math.erfc(-z / _SQRT_2)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _ppf_kernel(p, mu, sigma, out):
+    for i in prange(p.shape[0]):
+        for j in range(p.shape[1]):
+            out[i, j] = mu[i, j] + sigma[i, j] * _ndtri(p[i, j])
+    return out
+
+
+# coefficients of algorithm AS 241 (Wichura, 1988), highest order first
+# central region, |p - 0.5| <= 0.425
+_AS241_A = np.array(
+    [
+        2509.0809287301226727,
+        33430.575583588128105,
+        67265.770927008700853,
+        45921.953931549871457,
+        13731.693765509461125,
+        1971.5909503065514427,
+        133.14166789178437745,
+        3.387132872796366608,
+    ]
+)
+_AS241_B = np.array(
+    [
+        5226.495278852545925,
+        28729.085735721942674,
+        39307.89580009271061,
+        21213.794301586595867,
+        5394.1960214247511077,
+        687.1870074920579083,
+        42.313330701600911252,
+        1.0,
+    ]
+)
+# intermediate tails, sqrt(-log(min(p, 1 - p))) <= 5
+_AS241_C = np.array(
+    [
+        7.7454501427834140764e-4,
+        0.0227238449892691845833,
+        0.24178072517745061177,
+        1.27045825245236838258,
+        3.64784832476320460504,
+        5.7694972214606914055,
+        4.6303378461565452959,
+        1.42343711074968357734,
+    ]
+)
+_AS241_D = np.array(
+    [
+        1.05075007164441684324e-9,
+        5.475938084995344946e-4,
+        0.0151986665636164571966,
+        0.14810397642748007459,
+        0.68976733498510000455,
+        1.6763848301838038494,
+        2.05319162663775882187,
+        1.0,
+    ]
+)
+# far tails
+_AS241_E = np.array(
+    [
+        2.01033439929228813265e-7,
+        2.71155556874348757815e-5,
+        0.0012426609473880784386,
+        0.026532189526576123093,
+        0.29656057182850489123,
+        1.7848265399172913358,
+        5.4637849111641143699,
+        6.6579046435011037772,
+    ]
+)
+_AS241_F = np.array(
+    [
+        2.04426310338993978564e-15,
+        1.4215117583164458887e-7,
+        1.8463183175100546818e-5,
+        7.868691311456132591e-4,
+        0.0148753612908506148525,
+        0.13692988092273580531,
+        0.59983220655588793769,
+        1.0,
+    ]
+)
+
+
+@njit(cache=True)
+def _horner(coefs, r):
+    val = 0.0
+    for c in coefs:
+        val = val * r + c
+    return val
+
+
+@njit(cache=True)
+def _ndtri(p):
+    """Standard normal quantile function, algorithm AS 241 (Wichura, 1988).
+
+    Relative accuracy is about 1e-16, in line with `scipy.special.ndtri`.
+    """
+    if np.isnan(p) or p < 0.0 or p > 1.0:
+        return np.nan
+    if p == 0.0:
+        return -np.inf
+    if p == 1.0:
+        return np.inf
+
+    q = p - 0.5
+    if abs(q) <= 0.425:
+        r = 0.180625 - q * q
+        return q * _horner(_AS241_A, r) / _horner(_AS241_B, r)
+
+    if q < 0.0:
+        r = math.sqrt(-math.log(p))
+    else:
+        r = math.sqrt(-math.log(1.0 - p))
+
+    if r <= 5.0:
+        r -= 1.6
+        val = _horner(_AS241_C, r) / _horner(_AS241_D, r)
+    else:
+        r -= 5.0
+        val = _horner(_AS241_E, r) / _horner(_AS241_F, r)
+
+    if q < 0.0:
+        val = -val
+    return val
@@ -38,7 +38,18 @@ class BaseDistribution(BaseObject):
         self.columns = columns
 
         super(BaseDistribution, self).__init__()
-        _check_estimator_deps(self)
+
+        # shape is stored once, index and columns are fixed after construction
+        if index is not None and columns is not None:
+            self._shape = (len(index), len(columns))
+
+        # dependencies are checked only once per class, not on every construction,
+        # since subsetting via loc and iloc constructs new instances of the class
+        # the flag is looked up in the class __dict__, so it is not inherited
+        cls = type(self)
+        if not cls.__dict__.get("_deps_checked", False):
+            _check_estimator_deps(self)
+            cls._deps_checked = True
 
     @property
     def loc(self):
@@ -54,7 +65,11 @@ class BaseDistribution(BaseObject):
         to exactly the same/cols rows as `pandas` `loc` would subset
         rows in `my_distribution.index` and columns in `my_distribution.columns`.
         """
-        return _Indexer(ref=self, method="_loc")
+        # the indexer is created on first access and then stored on self,
+        # to avoid instantiating a new indexer on every subsetting call
+        if not hasattr(self, "_loc_indexer"):
+            self._loc_indexer = _Indexer(ref=self, method="_loc")
+        return self._loc_indexer
 
     @property
     def iloc(self):
@@ -70,39 +85,65 @@ class BaseDistribution(BaseObject):
         to exactly the same/cols rows as `pandas` `iloc` would subset
         rows in `my_distribution.index` and columns in `my_distribution.columns`.
         """
-        return _Indexer(ref=self, method="_iloc")
+        # the indexer is created on first access and then stored on self,
+        # to avoid instantiating a new indexer on every subsetting call
+        if not hasattr(self, "_iloc_indexer"):
+            self._iloc_indexer = _Indexer(ref=self, method="_iloc")
+        return self._iloc_indexer
 
     @property
     def shape(self):
         """Shape of self, a pair (2-tuple)."""
+        if hasattr(self, "_shape"):
+            return self._shape
         return (len(self.index), len(self.columns))
 
     def _loc(self, rowidx=None, colidx=None):
-        if rowidx is not None:
-            row_iloc = self.index.get_indexer_for(rowidx)
-        else:
-            row_iloc = None
-        if colidx is not None:
-            col_iloc = self.columns.get_indexer_for(colidx)
-        else:
-            col_iloc = None
+        def get_iloc(idx, subs):
+            if subs is None:
+                return None
+            # label slices are translated to an integer slice, without lookup
+            # of individual labels; arithmetic only, in case of RangeIndex
+            if isinstance(subs, slice):
+                return idx.slice_indexer(subs.start, subs.stop, subs.step)
+            return idx.get_indexer_for(subs)
+
+        row_iloc = get_iloc(self.index, rowidx)
+        col_iloc = get_iloc(self.columns, colidx)
         return self._iloc(rowidx=row_iloc, colidx=col_iloc)
 
+    def _get_param_arrays(self):
+        """Return distribution parameters of self as float arrays, cached on self."""
+        # converted only once, since subsetting may be called many times on self
+        if not hasattr(self, "_param_arrays"):
+            param_arrays = {}
+            for param, val in self._get_dist_params().items():
+                arr = np.asarray(val)
+                if np.issubdtype(arr.dtype, np.integer):
+                    arr = arr.astype("float")
+                param_arrays[param] = arr
+            self._param_arrays = param_arrays
+        return self._param_arrays
+
     def _subset_params(self, rowidx, colidx):
 
-        params = self._get_dist_params()
+        param_arrays = self._get_param_arrays()
+
+        def is_intarray(subs):
+            return subs is not None and not isinstance(subs, slice)
 
         subset_param_dict = {}
-        for param, val in params.items():
-            arr = np.array(val)
-            if len(arr.shape) == 0:
-                subset_param_dict
-            if len(arr.shape) >= 1 and rowidx is not None:
+        for param, arr in param_arrays.items():
+            if arr.ndim >= 2 and rowidx is not None and colidx is not None:
+                # single indexing operation, no intermediate row subset
+                if is_intarray(rowidx) and is_intarray(colidx):
+                    arr = arr[np.ix_(rowidx, colidx)]
+                else:
+                    arr = arr[rowidx, colidx]
+            elif arr.ndim >= 1 and rowidx is not None:
                 arr = arr[rowidx]
-            if len(arr.shape) >= 2 and colidx is not None:
+            elif arr.ndim >= 2 and colidx is not None:
                 arr = arr[:, colidx]
-            if np.issubdtype(arr.dtype, np.integer):
-                arr = arr.astype("float")
             subset_param_dict[param] = arr
         return subset_param_dict
 
@@ -112,10 +153,12 @@ class BaseDistribution(BaseObject):
         # distr_subset = distr_type(**subset_params)
 
         def subset_not_none(idx, subs):
-            if subs is not None:
-                return idx.take(subs)
-            else:
+            if subs is None:
                 return idx
+            # slicing keeps RangeIndex a RangeIndex, take would materialize it
+            if isinstance(subs, slice):
+                return idx[subs]
+            return idx.take(subs)
 
         index_subset = subset_not_none(self.index, rowidx)
         columns_subset = subset_not_none(self.columns, colidx)
@@ -378,6 +421,14 @@ class BaseDistribution(BaseObject):
         raise NotImplementedError(self._method_err_msg("sample", "error"))
 
 
+def _is_noneslice(obj):
+    """Check whether obj is the full slice, of the form `:`."""
+    # exact type check suffices, slice cannot be subclassed
+    res = type(obj) is slice
+    res = res and obj.start is None and obj.stop is None and obj.step is None
+    return res
+
+
 class _Indexer:
     """Indexer for BaseDistribution, for pandas-like index in loc and iloc property."""
 
@@ -387,16 +438,10 @@ class _Indexer:
 
     def __getitem__(self, key):
         """Getitem dunder, for use in my_distr.loc[index] an my_distr.iloc[index]."""
-
-        def is_noneslice(obj):
-            res = isinstance(obj, slice)
-            res = res and obj.start is None and obj.stop is None and obj.step is None
-            return res
-
         ref = self.ref
         indexer = getattr(ref, self.method)
 
-        if isinstance(key, tuple):
+        if type(key) is tuple or isinstance(key, tuple):
             if not len(key) == 2:
                 raise ValueError(
                     "there should be one or two keys when calling .loc, "
@@ -404,11 +449,11 @@ class _Indexer:
                 )
             rows = key[0]
             cols = key[1]
-            if is_noneslice(rows) and is_noneslice(cols):
+            if _is_noneslice(rows) and _is_noneslice(cols):
                 return ref
-            elif is_noneslice(cols):
+            elif _is_noneslice(cols):
                 return indexer(rowidx=rows, colidx=None)
-            elif is_noneslice(rows):
+            elif _is_noneslice(rows):
                 return indexer(rowidx=None, colidx=cols)
             else:
                 return indexer(rowidx=rows, colidx=cols)
@@ -558,6 +603,6 @@ def _prod_multiindex(ix1, ix2):
 
     rows = add_rows(rows, ix1)
     rows = add_rows(rows, ix2)
-    res = pd.MultiIndex.from_product(rows)
-    res.names = [None] * len(res.names)
+    # names are passed explicitly, to avoid inferring them and resetting after
+    res = pd.MultiIndex.from_product(rows, names=[None] * len(rows))
     return res
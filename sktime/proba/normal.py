@@ -6,9 +6,18 @@ __author__ = ["fkiraly"]
 
 import numpy as np
 import pandas as pd
-from scipy.special import erf, erfinv
+from scipy.special import ndtr, ndtri
 
-from sktime.proba.base import BaseDistribution
+from sktime.proba.base import BaseDistribution, _prod_multiindex
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+# constant used in the pdf computations
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+# minimal number of entries for which the fused numba kernels are used,
+# below this, thread dispatch overhead of the parallel kernels outweighs the gain
+_NUMBA_MIN_SIZE = 100000
+_NUMBA_AVAILABLE = _check_soft_dependencies("numba", severity="none")
 
 
 class Normal(BaseDistribution):
@@ -22,6 +31,9 @@ class Normal(BaseDistribution):
         standard deviation of the normal distribution
     index : pd.Index, optional, default = RangeIndex
     columns : pd.Index, optional, default = RangeIndex
+    dtype : str or numpy dtype, optional, default = "float" (i.e., float64)
+        floating point type of parameters, and of return values of methods,
+        e.g., "float32" halves memory and bandwidth in elementwise methods
 
     Example
     -------
@@ -36,17 +48,19 @@ class Normal(BaseDistribution):
         "distr:measuretype": "continuous",
     }
 
-    def __init__(self, mu, sigma, index=None, columns=None):
+    def __init__(self, mu, sigma, index=None, columns=None, dtype="float"):
 
         self.mu = mu
         self.sigma = sigma
         self.index = index
         self.columns = columns
+        self.dtype = dtype
 
         # todo: untangle index handling
         # and broadcast of parameters.
         # move this functionality to the base class
         # 0.18.0?
+        self._sigma_is_scalar = np.ndim(sigma) == 0
         self._mu, self._sigma = self._get_bc_params()
         shape = self._mu.shape
 
@@ -59,14 +73,116 @@ class Normal(BaseDistribution):
         super(Normal, self).__init__(index=index, columns=columns)
 
     def _get_bc_params(self):
-        """Fully broadcast parameters of self, given param shapes and index, columns."""
-        to_broadcast = [self.mu, self.sigma]
+        """Fully broadcast parameters of self, given param shapes and index, columns.
+
+        A scalar `sigma` is not broadcast, but returned as a numpy scalar of `dtype`,
+        which is used as a scalar operand in all downstream arithmetic.
+        """
+        if self._sigma_is_scalar:
+            to_broadcast = [self.mu]
+        else:
+            to_broadcast = [self.mu, self.sigma]
         if hasattr(self, "index") and self.index is not None:
             to_broadcast += [self.index.to_numpy().reshape(-1, 1)]
         if hasattr(self, "columns") and self.columns is not None:
             to_broadcast += [self.columns.to_numpy()]
         bc = np.broadcast_arrays(*to_broadcast)
-        return bc[0], bc[1]
+        # coerced once to contiguous float arrays, used by all methods
+        mu = np.ascontiguousarray(bc[0], dtype=self.dtype)
+        if self._sigma_is_scalar:
+            return mu, np.asarray(self.sigma, dtype=self.dtype)[()]
+        return mu, np.ascontiguousarray(bc[1], dtype=self.dtype)
+
+    def _get_dist_params(self):
+        """Return distribution parameters of self, i.e., without index, columns, dtype.
+
+        `dtype` is excluded, since it is not subset with rows and columns.
+        """
+        params = super(Normal, self)._get_dist_params()
+        params.pop("dtype", None)
+        return params
+
+    def _subset_params(self, rowidx, colidx):
+        """Return parameters for subset constructed in _iloc, with dtype of self."""
+        subset_params = super(Normal, self)._subset_params(rowidx, colidx)
+        # dtype is passed on unchanged, subsets of self keep its dtype
+        subset_params["dtype"] = self.dtype
+        return subset_params
+
+    def _get_params_at(self, x):
+        """Return mu and sigma of self, subset to the index and columns of x.
+
+        Parameters
+        ----------
+        x : pd.DataFrame, with index and columns contained in those of self
+
+        Returns
+        -------
+        mu, sigma : np.ndarray, broadcast parameters at index and columns of x
+        """
+        # fast path: if x is aligned with self, no subsetting via loc is needed
+        # this is the common case, e.g., if x is obtained from self.sample
+        index_aligned = x.index is self.index or x.index.equals(self.index)
+        columns_aligned = x.columns is self.columns or x.columns.equals(self.columns)
+        if index_aligned and columns_aligned:
+            return self._mu, self._sigma
+
+        d = self.loc[x.index, x.columns]
+        return d._mu, d._sigma
+
+    @staticmethod
+    def _use_numba(x):
+        """Whether to use the numba kernels for elementwise methods at x."""
+        if not _NUMBA_AVAILABLE or x.size < _NUMBA_MIN_SIZE:
+            return False
+
+        import numba
+
+        # single-threaded, the fused kernels are not faster than numpy/scipy
+        return numba.get_num_threads() > 1
+
+    def _apply_numba_kernel(self, kernel_name, x, mu, sigma):
+        """Apply a fused elementwise numba kernel from _normal_numba at x.
+
+        Parameters
+        ----------
+        kernel_name : str, name of the kernel in sktime.proba._normal_numba
+        x : pd.DataFrame, argument of the elementwise method
+        mu, sigma : np.ndarray, broadcastable to the shape of x
+
+        Returns
+        -------
+        np.ndarray of self.dtype, same shape as x, result of the kernel
+        """
+        from sktime.proba import _normal_numba
+
+        kernel = getattr(_normal_numba, kernel_name)
+        x_arr = x.to_numpy(dtype=self.dtype, copy=False)
+        mu = np.broadcast_to(mu, x_arr.shape)
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=self.dtype), x_arr.shape)
+        out = np.empty(x_arr.shape, dtype=self.dtype)
+        return kernel(x_arr, mu, sigma, out)
+
+    @staticmethod
+    def _pdf_cdf_values(z, sigma):
+        """Return pdf and cdf values, given standardized z = (x - mu) / sigma.
+
+        Parameters
+        ----------
+        z : np.ndarray of float, standardized argument, not modified
+        sigma : float or np.ndarray, broadcastable to shape of z
+
+        Returns
+        -------
+        pdf_arr : np.ndarray of float, same shape as z, pdf at x
+        cdf_arr : np.ndarray of float, same shape as z, cdf at x
+        """
+        cdf_arr = ndtr(z)
+        pdf_arr = np.multiply(z, z)
+        pdf_arr *= -0.5
+        np.exp(pdf_arr, out=pdf_arr)
+        pdf_arr /= sigma * _SQRT_2PI
+        return pdf_arr, cdf_arr
 
     def energy(self, x=None):
         r"""Energy of self, w.r.t. self or a constant frame x.
@@ -87,12 +203,24 @@ class Normal(BaseDistribution):
         each row contains one float, self-energy/energy as described above.
         """
         if x is None:
-            sd_arr = self._sigma
-            energy_arr = 2 * np.sum(sd_arr, axis=1) / np.sqrt(np.pi)
+            sd_arr = np.broadcast_to(self._sigma, self._mu.shape)
+            energy_arr = np.sum(sd_arr, axis=1)
+            # in place, to keep dtype of self under any numpy promotion rules
+            energy_arr *= 2 / np.sqrt(np.pi)
             energy = pd.DataFrame(energy_arr, index=self.index, columns=["energy"])
         else:
             mu_arr, sd_arr = self._mu, self._sigma
-            c_arr = (x - mu_arr) * (2 * self.cdf(x) - 1) + 2 * sd_arr**2 * self.pdf(x)
+            # (x - mu) * (2 * cdf(x) - 1) + 2 * sigma**2 * pdf(x),
+            # with cdf and pdf computed from one shared standardized z
+            z = np.subtract(x.to_numpy(dtype=self.dtype, copy=False), mu_arr)
+            z /= sd_arr
+            pdf_arr, c_arr = self._pdf_cdf_values(z, sd_arr)
+            c_arr *= 2
+            c_arr -= 1
+            c_arr *= z
+            c_arr *= sd_arr
+            pdf_arr *= 2 * sd_arr**2
+            c_arr += pdf_arr
             energy_arr = np.sum(c_arr, axis=1)
             energy = pd.DataFrame(energy_arr, index=self.index, columns=["energy"])
         return energy
@@ -122,33 +250,57 @@ class Normal(BaseDistribution):
         pd.DataFrame with same rows, columns as `self`
         variance of distribution (entry-wise)
         """
-        sd_arr = self._sigma
+        sd_arr = np.broadcast_to(self._sigma, self._mu.shape)
         return pd.DataFrame(sd_arr, index=self.index, columns=self.columns) ** 2
 
     def pdf(self, x):
         """Probability density function."""
-        d = self.loc[x.index, x.columns]
-        pdf_arr = np.exp(-0.5 * ((x.values - d.mu) / d.sigma) ** 2)
-        pdf_arr = pdf_arr / (d.sigma * np.sqrt(2 * np.pi))
+        mu, sigma = self._get_params_at(x)
+        if self._use_numba(x):
+            pdf_arr = self._apply_numba_kernel("_pdf_kernel", x, mu, sigma)
+            return pd.DataFrame(pdf_arr, index=x.index, columns=x.columns)
+        # computed in place on a single buffer, to avoid temporary arrays
+        pdf_arr = np.subtract(x.to_numpy(dtype=self.dtype, copy=False), mu)
+        pdf_arr /= sigma
+        pdf_arr *= pdf_arr
+        pdf_arr *= -0.5
+        np.exp(pdf_arr, out=pdf_arr)
+        pdf_arr /= sigma * _SQRT_2PI
         return pd.DataFrame(pdf_arr, index=x.index, columns=x.columns)
 
     def log_pdf(self, x):
         """Logarithmic probability density function."""
-        d = self.loc[x.index, x.columns]
-        lpdf_arr = -0.5 * ((x.values - d.mu) / d.sigma) ** 2
-        lpdf_arr = lpdf_arr - np.log(d.sigma * np.sqrt(2 * np.pi))
+        mu, sigma = self._get_params_at(x)
+        if self._use_numba(x):
+            lpdf_arr = self._apply_numba_kernel("_log_pdf_kernel", x, mu, sigma)
+            return pd.DataFrame(lpdf_arr, index=x.index, columns=x.columns)
+        lpdf_arr = np.subtract(x.to_numpy(dtype=self.dtype, copy=False), mu)
+        lpdf_arr /= sigma
+        lpdf_arr *= lpdf_arr
+        lpdf_arr *= -0.5
+        lpdf_arr -= np.log(sigma * _SQRT_2PI)
         return pd.DataFrame(lpdf_arr, index=x.index, columns=x.columns)
 
     def cdf(self, x):
         """Cumulative distribution function."""
-        d = self.loc[x.index, x.columns]
-        cdf_arr = 0.5 + 0.5 * erf((x.values - d.mu) / (d.sigma * np.sqrt(2)))
+        mu, sigma = self._get_params_at(x)
+        if self._use_numba(x):
+            cdf_arr = self._apply_numba_kernel("_cdf_kernel", x, mu, sigma)
+            return pd.DataFrame(cdf_arr, index=x.index, columns=x.columns)
+        cdf_arr = np.subtract(x.to_numpy(dtype=self.dtype, copy=False), mu)
+        cdf_arr /= sigma
+        ndtr(cdf_arr, out=cdf_arr)
         return pd.DataFrame(cdf_arr, index=x.index, columns=x.columns)
 
     def ppf(self, p):
         """Quantile function = percent point function = inverse cdf."""
-        d = self.loc[p.index, p.columns]
-        icdf_arr = d.mu + d.sigma * np.sqrt(2) * erfinv(2 * p.values - 1)
+        mu, sigma = self._get_params_at(p)
+        if self._use_numba(p):
+            icdf_arr = self._apply_numba_kernel("_ppf_kernel", p, mu, sigma)
+            return pd.DataFrame(icdf_arr, index=p.index, columns=p.columns)
+        icdf_arr = ndtri(p.to_numpy(dtype=self.dtype, copy=False))
+        icdf_arr *= sigma
+        icdf_arr += mu
         return pd.DataFrame(icdf_arr, index=p.index, columns=p.columns)
 
     def sample(self, n_samples=None):
@@ -168,17 +320,25 @@ class Normal(BaseDistribution):
         in `pd-multiindex` mtype format convention, with same `columns` as `self`,
         and `MultiIndex` that is product of `RangeIndex(n_samples)` and `self.index`
         """
-
-        def gen_unif():
-            np_unif = np.random.uniform(size=self.shape)
-            return pd.DataFrame(np_unif, index=self.index, columns=self.columns)
+        mu, sigma = self._mu, self._sigma
 
         if n_samples is None:
-            return self.ppf(gen_unif())
-        else:
-            pd_smpl = [self.ppf(gen_unif()) for _ in range(n_samples)]
-            df_spl = pd.concat(pd_smpl, keys=range(n_samples))
-            return df_spl
+            np_spl = np.random.standard_normal(size=mu.shape)
+            np_spl = np_spl.astype(self.dtype, copy=False)
+            np_spl *= sigma
+            np_spl += mu
+            return pd.DataFrame(np_spl, index=self.index, columns=self.columns)
+
+        # all samples are drawn at once, broadcasting against mu and sigma,
+        # then stacked to the (n_samples * n_rows, n_cols) pd-multiindex frame
+        np_spl = np.random.standard_normal(size=(n_samples,) + mu.shape)
+        np_spl = np_spl.astype(self.dtype, copy=False)
+        np_spl *= sigma
+        np_spl += mu
+        np_spl = np_spl.reshape(-1, mu.shape[1])
+        mi = _prod_multiindex(pd.RangeIndex(n_samples), self.index)
+        df_spl = pd.DataFrame(np_spl, index=mi, columns=self.columns, copy=False)
+        return df_spl
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -190,4 +350,5 @@ class Normal(BaseDistribution):
             "index": pd.Index([1, 2, 5]),
             "columns": pd.Index(["a", "b"]),
         }
-        return [params1, params2]
+        params3 = {"mu": [[0, 1], [2, 3], [4, 5]], "sigma": 1, "dtype": "float32"}
+        return [params1, params2, params3]
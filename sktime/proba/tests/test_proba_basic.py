@@ -24,3 +24,151 @@ def test_proba_example():
     one_row = n.loc[[1]]
     assert isinstance(one_row, TFNormal)
     assert one_row.shape == (1, 2)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency is not available",
+)
+@pytest.mark.parametrize("method", ["pdf", "log_pdf", "cdf", "ppf"])
+def test_normal_numba_kernels(method):
+    """Test that numba kernels of Normal agree with the numpy/scipy path."""
+    import numpy as np
+    import pandas as pd
+
+    from sktime.proba.normal import Normal
+
+    n = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=[[1, 2], [3, 4], [5, 6]])
+
+    if method == "ppf":
+        x = pd.DataFrame([[0, 0.1], [0.5, 0.7], [0.99, 1]])
+    else:
+        x = pd.DataFrame([[-1, 0.5], [2, 10], [4.2, -30]])
+
+    mu, sigma = n._get_params_at(x)
+    res_numba = n._apply_numba_kernel(f"_{method}_kernel", x, mu, sigma)
+    res_numpy = getattr(n, method)(x).values
+
+    np.testing.assert_allclose(res_numba, res_numpy, rtol=1e-12)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency is not available",
+)
+def test_normal_numba_dispatch(monkeypatch):
+    """Test that public Normal methods dispatch to numba kernels correctly."""
+    import numba
+    import numpy as np
+    import pandas as pd
+
+    from sktime.proba import normal
+    from sktime.proba.normal import Normal
+
+    n = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=[[1, 2], [3, 4], [5, 6]])
+    x = pd.DataFrame([[-1, 0.5], [2, 10], [4.2, -30]])
+    p = pd.DataFrame([[0, 0.1], [0.5, 0.7], [0.99, 1]])
+    args = {"pdf": x, "log_pdf": x, "cdf": x, "ppf": p}
+
+    # reference results from the numpy/scipy path
+    monkeypatch.setattr(normal, "_NUMBA_AVAILABLE", False)
+    assert not n._use_numba(x)
+    expected = {method: getattr(n, method)(arg) for method, arg in args.items()}
+
+    # force dispatch to the numba kernels, regardless of size and threads
+    monkeypatch.setattr(normal, "_NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(normal, "_NUMBA_MIN_SIZE", 0)
+    monkeypatch.setattr(numba, "get_num_threads", lambda: 2)
+    assert n._use_numba(x)
+
+    for method, arg in args.items():
+        res = getattr(n, method)(arg)
+        assert res.index.equals(arg.index)
+        assert res.columns.equals(arg.columns)
+        np.testing.assert_allclose(res, expected[method], rtol=1e-12)
+
+
+def test_proba_slicing():
+    """Test slice subsetting via loc and iloc for BaseDistribution."""
+    import numpy as np
+    import pandas as pd
+
+    from sktime.proba.normal import Normal
+
+    n = Normal(mu=[[0, 1], [2, 3], [4, 5], [6, 7]], sigma=1)
+
+    rows = n.iloc[1:3]
+    assert isinstance(rows, Normal)
+    assert rows.shape == (2, 2)
+    assert isinstance(rows.index, pd.RangeIndex)
+    np.testing.assert_array_equal(rows.mean(), n.mean().iloc[1:3])
+
+    # label based slices include the end point, as in pandas
+    rows_loc = n.loc[1:2, 1:]
+    assert rows_loc.shape == (2, 1)
+    np.testing.assert_array_equal(rows_loc.mean(), n.mean().loc[1:2, 1:])
+
+
+def test_proba_chained_indexing():
+    """Test indexing of temporary BaseDistribution objects, e.g., chained loc."""
+    from sktime.proba.normal import Normal
+
+    # the indexer must keep the temporary distribution it subsets alive
+    one_entry = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=1).iloc[[1, 2]].loc[[2], [1]]
+    assert isinstance(one_entry, Normal)
+    assert one_entry.shape == (1, 1)
+    assert one_entry.mean().iloc[0, 0] == 5
+
+
+def test_proba_indexer_reuse():
+    """Test that loc and iloc indexers are created once per distribution."""
+    from sktime.proba.normal import Normal
+
+    n = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=1)
+
+    assert n.loc is n.loc
+    assert n.iloc is n.iloc
+    assert n.loc is not n.iloc
+
+    # indexers are not shared between distribution objects
+    n_clone = n.clone()
+    assert n_clone.loc is not n.loc
+    assert n_clone.loc.ref is n_clone
+
+
+def test_normal_dtype():
+    """Test that the dtype parameter of Normal is kept in methods and subsets."""
+    import numpy as np
+    import pandas as pd
+
+    from sktime.proba.normal import Normal
+
+    n = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=[[1, 2], [3, 4], [5, 6]])
+    n32 = Normal(
+        mu=[[0, 1], [2, 3], [4, 5]], sigma=[[1, 2], [3, 4], [5, 6]], dtype="float32"
+    )
+
+    x = pd.DataFrame([[-1, 0.5], [2, 10], [4.2, 3]])
+    p = pd.DataFrame([[0.1, 0.5], [0.3, 0.7], [0.99, 0.2]])
+
+    for method, arg in [("pdf", x), ("log_pdf", x), ("cdf", x), ("ppf", p)]:
+        res32 = getattr(n32, method)(arg)
+        assert (res32.dtypes == np.float32).all()
+        np.testing.assert_allclose(res32, getattr(n, method)(arg), rtol=1e-5)
+
+    assert (n32.mean().dtypes == np.float32).all()
+    assert (n32.sample(3).dtypes == np.float32).all()
+
+    subset = n32.loc[[1, 2], [1]]
+    assert subset.dtype == "float32"
+    assert subset.get_params()["dtype"] == "float32"
+    assert (subset.var().dtypes == np.float32).all()
+
+    # scalar sigma is not broadcast, it must also be of dtype
+    n32_scalar = Normal(mu=[[0, 1], [2, 3], [4, 5]], sigma=2, dtype="float32")
+    for method, arg in [("pdf", x), ("log_pdf", x), ("cdf", x), ("ppf", p)]:
+        assert (getattr(n32_scalar, method)(arg).dtypes == np.float32).all()
+    assert (n32_scalar.var().dtypes == np.float32).all()
+    assert (n32_scalar.energy().dtypes == np.float32).all()
+    assert (n32_scalar.energy(x).dtypes == np.float32).all()
+    assert (n32_scalar.sample().dtypes == np.float32).all()
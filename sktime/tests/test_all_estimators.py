@@ -683,17 +683,29 @@ class QuickTester:
 
         marks = [x for x in fun.pytestmark if x.name == "parametrize"]
 
+        # values can be passed as pytest.param, these carry the value and the id
+        ParameterSet = type(pytest.param(None))
+
         def to_str(obj):
             return [str(x) for x in obj]
 
+        def get_values(mark):
+            values = mark.args[1]
+            return [x.values[0] if isinstance(x, ParameterSet) else x for x in values]
+
         def get_id(mark):
             if "ids" in mark.kwargs.keys():
                 return mark.kwargs["ids"]
             else:
-                return to_str(range(len(mark.args[1])))
+                values = mark.args[1]
+                ids = to_str(range(len(values)))
+                for i, x in enumerate(values):
+                    if isinstance(x, ParameterSet) and x.id is not None:
+                        ids[i] = x.id
+                return ids
 
         pytest_fixture_vars = [x.args[0] for x in marks]
-        pytest_fixt_raw = [x.args[1] for x in marks]
+        pytest_fixt_raw = [get_values(x) for x in marks]
         pytest_fixt_list = product(*pytest_fixt_raw)
         pytest_fixt_names_raw = [get_id(x) for x in marks]
         pytest_fixt_names = product(*pytest_fixt_names_raw)
@@ -129,11 +129,18 @@ def make_forecasting_problem(
     return y, X
 
 
-def _assert_correct_pred_time_index(y_pred_index, cutoff, fh):
+def _assert_correct_pred_time_index(y_pred_index, cutoff, fh, msg=None):
+    """Check that predicted time index matches fh, msg is prefixed to errors."""
     assert isinstance(y_pred_index, pd.Index)
     fh = check_fh(fh)
     expected = fh.to_absolute(cutoff).to_pandas()
-    y_pred_index.equals(expected)
+    # message is only formatted on failure, index reprs are expensive
+    if not y_pred_index.equals(expected):
+        prefix = "" if msg is None else f"{msg}: "
+        raise AssertionError(
+            f"{prefix}predicted time index does not match forecasting horizon, "
+            f"expected {expected} but found {y_pred_index}"
+        )
 
 
 def _assert_correct_columns(y_pred, y_train):